@@ -7,167 +7,547 @@ This script allows you to manage your Claude conversation memories:
 - View the contents of a specific memory
 - Delete a memory
 - Create a new memory with custom instructions
+- Append a message to a conversation memory
 """
 
 import os
 import sys
 import json
+import time
+import string
+import hashlib
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
+from typing import NamedTuple
 
-# Initialize console for rich text output
-console = Console()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # Default memory file location
 DEFAULT_MEMORY_DIR = Path.home() / ".claude_memory"
 DEFAULT_MEMORY_FILE = DEFAULT_MEMORY_DIR / "memory.json"
+MEMORY_INDEX_FILE = DEFAULT_MEMORY_DIR / "index.json"
+CONVERSATION_MEMORY_DIR = DEFAULT_MEMORY_DIR / "conversations"
 CUSTOM_MEMORY_DIR = DEFAULT_MEMORY_DIR / "custom_memories"
 
+# ANSI codes for status messages, which are printed without rich
+STATUS_COLORS = {"green": "\033[1;32m", "yellow": "\033[1;33m", "red": "\033[1;31m"}
+
+# Styles for message headers when viewing a conversation
+USER_STYLE = "bold blue"
+CLAUDE_STYLE = "bold green"
+
+# Printed between messages when viewing a conversation
+MESSAGE_SEPARATOR = "\n" + "-" * 80 + "\n"
+
+# Leading bytes of a zstd frame, used to detect compressed memory files
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Longest encoded memory ID used verbatim as a file name; leaves room for the
+# ".jsonl.tmp" suffix within the common 255-byte file name limit
+MAX_FILE_STEM = 255 - len(".jsonl.tmp")
+
+# Start of every line append_message() writes, used to recover a message that
+# was appended onto the remains of a torn append
+MESSAGE_PREFIX = b'{"role":'
+
+# Characters kept verbatim in memory file names. Uppercase letters are
+# percent-encoded too, so IDs differing only in case get distinct file names
+# on case-insensitive filesystems.
+FILE_NAME_SAFE_CHARS = frozenset(string.ascii_lowercase + string.digits + "-_.~")
+
+# Device names Windows reserves regardless of extension
+WINDOWS_RESERVED_NAMES = frozenset(
+    ["con", "prn", "aux", "nul"]
+    + [f"com{i}" for i in range(1, 10)]
+    + [f"lpt{i}" for i in range(1, 10)]
+)
+
+# Index section for each memory type
+INDEX_KEYS = {"conversation": "conversations", "custom": "custom_memories"}
+
+class Message(NamedTuple):
+    """A single message in a conversation memory."""
+    role: str
+    content: str
+
+# Parsed JSON files, reused while their (mtime, size) is unchanged
+_MEMORY_CACHE = {}
+
+# Set once setup_memory_dirs() has run in this process
+_DIRS_READY = False
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
+def _supports_color() -> bool:
+    """Return whether stdout is a terminal that understands ANSI escapes."""
+    if not sys.stdout.isatty() or "NO_COLOR" in os.environ:
+        return False
+    
+    # Legacy Windows consoles print escapes literally; Windows Terminal and
+    # ANSICON translate them
+    if os.name == "nt":
+        return "WT_SESSION" in os.environ or "ANSICON" in os.environ
+    return True
+
+def _echo(message: str, color: str) -> None:
+    """Print a bold status message, colored when the terminal supports it."""
+    if _supports_color():
+        message = f"{STATUS_COLORS[color]}{message}\033[0m"
+    print(message)
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(data) -> bytes:
+    """Serialize data to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+def _file_key(path: Path) -> tuple:
+    """Return the stat key used to validate a cached file."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _read_json(path: Path):
+    """Read a JSON file, reusing the cached result if it hasn't changed."""
+    key = _file_key(path)
+    cached = _MEMORY_CACHE.get(str(path))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    # Parse the raw bytes directly rather than decoding them to str first
+    raw = path.read_bytes()
+    if raw.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+        try:
+            raw = zstandard.ZstdDecompressor().decompress(raw)
+        except zstandard.ZstdError as e:
+            raise RuntimeError(f"{path} is not a valid zstd file: {str(e)}")
+    data = _loads(raw)
+    
+    _MEMORY_CACHE[str(path)] = (key, data)
+    return data
+
+def _replace_file(path: Path, raw: bytes, fsync: bool = False) -> None:
+    """Replace a file's contents atomically.
+    
+    The bytes are written to a temporary file and renamed over the target,
+    so an interrupted save never leaves a truncated file behind. Pass
+    fsync=True to also flush it to disk before the rename.
+    """
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(raw)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+def _write_json(path: Path, data, fsync: bool = False, compress: bool = False) -> None:
+    """Write a JSON file atomically in compact form.
+    
+    Pass compress=True to zstd-compress it when zstandard is installed.
+    """
+    raw = _dumps(data)
+    if compress and zstandard is not None:
+        raw = zstandard.ZstdCompressor(level=3).compress(raw)
+    
+    _replace_file(path, raw, fsync=fsync)
+    _MEMORY_CACHE[str(path)] = (_file_key(path), data)
+
+def _memory_path(memory_type: str, memory_id: str) -> Path:
+    """Return the file holding the body of a memory.
+    
+    File names are unique even on case-insensitive filesystems:
+    
+    >>> _memory_path("custom", "X").name, _memory_path("custom", "x").name
+    ('%58.json', 'x.json')
+    >>> _memory_path("custom", "con").name
+    '%63on.json'
+    """
+    # Percent-encode the ID so it always maps to a single, non-hidden file name
+    name = "".join(
+        chr(byte) if chr(byte) in FILE_NAME_SAFE_CHARS else f"%{byte:02X}"
+        for byte in memory_id.encode("utf-8")
+    )
+    if name[:1] == "." or name.split(".")[0] in WINDOWS_RESERVED_NAMES:
+        name = f"%{ord(name[0]):02X}" + name[1:]
+    
+    # Empty IDs and IDs too long for a file name are hashed instead; "#" is
+    # always percent-encoded, so hashed names can't clash with verbatim ones
+    if not name or len(name) > MAX_FILE_STEM:
+        name = "#" + hashlib.sha256(memory_id.encode("utf-8")).hexdigest()
+    
+    if memory_type == "conversation":
+        return CONVERSATION_MEMORY_DIR / f"{name}.jsonl"
+    return CUSTOM_MEMORY_DIR / f"{name}.json"
+
+def _parse_message(line: bytes):
+    """Parse one conversation log line into a Message, or None if it isn't one."""
+    try:
+        message = _loads(line)
+        return Message(message["role"], message["content"])
+    except (ValueError, KeyError, TypeError):
+        # ValueError covers JSONDecodeError and the UnicodeDecodeError json
+        # raises for a character cut in half by a torn append
+        return None
+
+def _read_messages(path: Path) -> list:
+    """Read a conversation log, one JSON message per line.
+    
+    A torn append leaves a fragment without a trailing newline. As the last
+    line it is ignored; once another message has been appended onto it, the
+    message after the fragment is recovered. Lines that aren't messages are
+    skipped.
+    """
+    messages = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            
+            message = _parse_message(line)
+            if message is None:
+                # JSON escapes quotes inside strings, so MESSAGE_PREFIX can
+                # only appear where a message starts
+                start = line.rfind(MESSAGE_PREFIX)
+                if start > 0:
+                    message = _parse_message(line[start:])
+            if message is not None:
+                messages.append(message)
+    return messages
+
+def _count_messages(path: Path) -> int:
+    """Count the messages in a conversation log without parsing them."""
+    count = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            count += chunk.count(b"\n")
+    return count
+
+def _load_index() -> dict:
+    """Load the memory index, which maps memory IDs to their metadata."""
+    setup_memory_dirs()
+    
+    try:
+        index = _read_json(MEMORY_INDEX_FILE)
+    except (json.JSONDecodeError, FileNotFoundError):
+        index = {}
+    
+    for key in INDEX_KEYS.values():
+        index.setdefault(key, {})
+    return index
+
+def _save_index(index: dict, fsync: bool = False) -> None:
+    """Save the memory index."""
+    _write_json(MEMORY_INDEX_FILE, index, fsync=fsync)
+
+def _migrate_legacy_memory_file() -> None:
+    """Split a legacy single-file memory.json into per-memory files.
+    
+    The index records a completed migration, after which setup_memory_dirs()
+    only warns about a memory.json that reappears. Entries from the legacy
+    file replace existing memories with the same ID. The legacy file is kept
+    as memory.json.migrated (or memory.json.migrated.N if that already exists).
+    """
+    index = _load_index()
+    
+    try:
+        memory_data = _loads(DEFAULT_MEMORY_FILE.read_bytes())
+    except (json.JSONDecodeError, FileNotFoundError):
+        return
+    
+    now = time.time()
+    
+    for memory_id, messages in memory_data.get("conversations", {}).items():
+        log = b"".join(_dumps(message) + b"\n" for message in messages)
+        try:
+            _replace_file(_memory_path("conversation", memory_id), log)
+        except OSError as e:
+            _echo(f"Could not migrate conversation memory '{memory_id}': {str(e)}", "red")
+            continue
+        index["conversations"][memory_id] = {"created": now}
+    
+    for memory_id, memory_info in memory_data.get("custom_memories", {}).items():
+        try:
+            _write_json(_memory_path("custom", memory_id), memory_info, compress=True)
+        except OSError as e:
+            _echo(f"Could not migrate custom memory '{memory_id}': {str(e)}", "red")
+            continue
+        index["custom_memories"][memory_id] = {
+            "description": memory_info.get("description", ""),
+            "mtime": now
+        }
+    
+    index["legacy_migrated"] = now
+    _save_index(index, fsync=True)
+    
+    # Never overwrite the backup of an earlier migration
+    backup = DEFAULT_MEMORY_FILE.with_suffix(".json.migrated")
+    n = 0
+    while backup.exists():
+        n += 1
+        backup = DEFAULT_MEMORY_FILE.with_suffix(f".json.migrated.{n}")
+    os.replace(DEFAULT_MEMORY_FILE, backup)
+
 def setup_memory_dirs() -> None:
-    """Create the memory directories if they don't exist."""
+    """Create the memory directories and migrate any legacy memory file."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    
     DEFAULT_MEMORY_DIR.mkdir(exist_ok=True)
+    CONVERSATION_MEMORY_DIR.mkdir(exist_ok=True)
     CUSTOM_MEMORY_DIR.mkdir(exist_ok=True)
     
-    if not DEFAULT_MEMORY_FILE.exists():
-        with open(DEFAULT_MEMORY_FILE, 'w') as f:
-            json.dump({"conversations": {}, "custom_memories": {}}, f)
+    # Mark ready before migrating, since the migration loads the index itself
+    _DIRS_READY = True
+    if DEFAULT_MEMORY_FILE.exists():
+        if _load_index().get("legacy_migrated"):
+            _echo(f"Ignoring {DEFAULT_MEMORY_FILE}: a legacy memory file was already migrated. "
+                  f"Remove \"legacy_migrated\" from {MEMORY_INDEX_FILE} to import it.", "yellow")
+        else:
+            _migrate_legacy_memory_file()
 
-def load_memory_data() -> dict:
-    """Load all memory data from file."""
+def get_memory(memory_id: str, memory_type: str):
+    """Return a single memory entry, or None if it doesn't exist.
+    
+    Conversations are returned as a list of Message records. Raises
+    RuntimeError if a compressed memory file can't be decompressed.
+    """
     setup_memory_dirs()
+    path = _memory_path(memory_type, memory_id)
     
     try:
-        with open(DEFAULT_MEMORY_FILE, 'r') as f:
-            return json.load(f)
+        if memory_type == "conversation":
+            return _read_messages(path)
+        return _read_json(path)
     except (json.JSONDecodeError, FileNotFoundError):
-        return {"conversations": {}, "custom_memories": {}}
+        return None
 
-def save_memory_data(memory_data: dict) -> None:
-    """Save memory data to file."""
+def append_message(memory_id: str, role: str, content: str) -> None:
+    """Append a message to a conversation memory, creating it if needed.
+    
+    The message is added to the end of the conversation log with O_APPEND
+    writes, so the existing messages are never read or rewritten.
+    """
     setup_memory_dirs()
+    line = memoryview(_dumps({"role": role, "content": content}) + b"\n")
+    
+    fd = os.open(_memory_path("conversation", memory_id), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        while line:
+            line = line[os.write(fd, line):]
+    finally:
+        os.close(fd)
     
-    with open(DEFAULT_MEMORY_FILE, 'w') as f:
-        json.dump(memory_data, f, indent=2)
+    index = _load_index()
+    if memory_id not in index["conversations"]:
+        index["conversations"][memory_id] = {"created": time.time()}
+        _save_index(index)
+
+def iter_memory_summaries(memory_type: str):
+    """Yield (memory_id, summary) pairs without exposing message bodies.
+    
+    Conversation summaries are message counts, taken by counting the lines of
+    each conversation log. Custom summaries are descriptions from the index.
+    """
+    entries = _load_index()[INDEX_KEYS[memory_type]]
+    
+    if memory_type == "conversation":
+        for memory_id in entries:
+            try:
+                message_count = _count_messages(_memory_path(memory_type, memory_id))
+            except FileNotFoundError:
+                message_count = 0
+            yield memory_id, str(message_count)
+    else:
+        for memory_id, entry in entries.items():
+            yield memory_id, entry.get("description", "")
+
+def _memory_table(value_header: str, rows: list):
+    """Build a two-column rich Table from (memory_id, value) rows."""
+    from rich.table import Table
+    
+    table = Table(show_header=True)
+    table.add_column("ID", style="cyan")
+    table.add_column(value_header, style="green")
+    
+    # Table has no bulk insert; add_row only appends each cell to its column
+    for row in rows:
+        table.add_row(*row)
+    return table
 
 def list_memories() -> None:
     """List all available memories."""
-    memory_data = load_memory_data()
+    console = _get_console()
+    conversations = list(iter_memory_summaries("conversation"))
+    custom_memories = list(iter_memory_summaries("custom"))
     
     # List conversation memories
-    if memory_data["conversations"]:
-        console.print("\n[bold]Conversation Memories:[/bold]")
-        table = Table(show_header=True)
-        table.add_column("ID", style="cyan")
-        table.add_column("Messages", style="green")
-        
-        for memory_id, messages in memory_data["conversations"].items():
-            table.add_row(memory_id, str(len(messages)))
-        
-        console.print(table)
+    if conversations:
+        console.print("\n[bold]Conversation Memories:[/bold]", _memory_table("Messages", conversations), sep="\n")
     else:
         console.print("\n[bold yellow]No conversation memories found.[/bold yellow]")
     
     # List custom memories
-    if memory_data.get("custom_memories", {}):
-        console.print("\n[bold]Custom Memories:[/bold]")
-        table = Table(show_header=True)
-        table.add_column("ID", style="cyan")
-        table.add_column("Description", style="green")
-        
-        for memory_id, memory_info in memory_data["custom_memories"].items():
-            table.add_row(memory_id, memory_info.get("description", ""))
-        
-        console.print(table)
+    if custom_memories:
+        console.print("\n[bold]Custom Memories:[/bold]", _memory_table("Description", custom_memories), sep="\n")
     else:
         console.print("\n[bold yellow]No custom memories found.[/bold yellow]")
 
 def view_memory(memory_id: str, memory_type: str) -> None:
     """View the contents of a specific memory."""
-    memory_data = load_memory_data()
+    try:
+        memory = get_memory(memory_id, memory_type)
+    except RuntimeError as e:
+        _echo(f"Error reading memory '{memory_id}': {str(e)}", "red")
+        return
     
     if memory_type == "conversation":
-        if memory_id in memory_data["conversations"]:
-            messages = memory_data["conversations"][memory_id]
-            console.print(f"\n[bold]Conversation Memory: {memory_id}[/bold]")
-            console.print(f"[bold]Number of messages: {len(messages)}[/bold]\n")
+        if memory is not None:
+            from rich.text import Text
+            console = _get_console()
+            messages = memory
+            
+            # Build styled text directly so no per-message markup has to be parsed.
+            # Role headers keep their own style; everything else is highlighted
+            # the way console.print highlights plain strings.
+            highlight = console.highlighter
+            text = Text()
+            text.append_text(highlight(Text(f"\nConversation Memory: {memory_id}\n", style="bold")))
+            text.append_text(highlight(Text(f"Number of messages: {len(messages)}\n", style="bold")))
             
             for i, message in enumerate(messages):
-                role = message["role"]
-                content = message["content"]
-                
-                if role == "user":
-                    console.print(f"[bold blue]User ({i+1}):[/bold blue]")
+                if message.role == "user":
+                    text.append(f"\nUser ({i+1}):\n", style=USER_STYLE)
                 else:
-                    console.print(f"[bold green]Claude ({i+1}):[/bold green]")
+                    text.append(f"\nClaude ({i+1}):\n", style=CLAUDE_STYLE)
                 
-                console.print(content)
-                console.print("\n" + "-" * 80 + "\n")
+                text.append_text(highlight(Text(message.content + "\n" + MESSAGE_SEPARATOR)))
+            
+            console.print(text)
         else:
-            console.print(f"[bold red]Conversation memory '{memory_id}' not found.[/bold red]")
+            _echo(f"Conversation memory '{memory_id}' not found.", "red")
     
     elif memory_type == "custom":
-        if memory_id in memory_data.get("custom_memories", {}):
-            memory_info = memory_data["custom_memories"][memory_id]
+        if memory is not None:
+            memory_info = memory
+            console = _get_console()
             console.print(f"\n[bold]Custom Memory: {memory_id}[/bold]")
             console.print(f"[bold]Description: {memory_info.get('description', '')}[/bold]\n")
             console.print(memory_info.get("content", ""))
         else:
-            console.print(f"[bold red]Custom memory '{memory_id}' not found.[/bold red]")
+            _echo(f"Custom memory '{memory_id}' not found.", "red")
+
+def _remove_memory(index: dict, memory_type: str, memory_id: str) -> None:
+    """Drop a memory from the index, then remove its file."""
+    # Only rewrite the index when it actually listed the memory
+    if index[INDEX_KEYS[memory_type]].pop(memory_id, None) is not None:
+        _save_index(index)
+    
+    try:
+        os.unlink(_memory_path(memory_type, memory_id))
+    except FileNotFoundError:
+        pass
 
 def delete_memory(memory_id: str, memory_type: str) -> None:
     """Delete a memory."""
-    memory_data = load_memory_data()
+    setup_memory_dirs()
+    # The stat settles the common case; fall back to the index so entries
+    # whose file has gone missing can still be removed
+    exists = (_memory_path(memory_type, memory_id).exists()
+              or memory_id in _load_index()[INDEX_KEYS[memory_type]])
     
     if memory_type == "conversation":
-        if memory_id in memory_data["conversations"]:
-            del memory_data["conversations"][memory_id]
-            save_memory_data(memory_data)
-            console.print(f"[bold green]Conversation memory '{memory_id}' deleted successfully.[/bold green]")
+        if exists:
+            _remove_memory(_load_index(), memory_type, memory_id)
+            _echo(f"Conversation memory '{memory_id}' deleted successfully.", "green")
         else:
-            console.print(f"[bold red]Conversation memory '{memory_id}' not found.[/bold red]")
+            _echo(f"Conversation memory '{memory_id}' not found.", "red")
     
     elif memory_type == "custom":
-        if memory_id in memory_data.get("custom_memories", {}):
-            del memory_data["custom_memories"][memory_id]
-            save_memory_data(memory_data)
-            console.print(f"[bold green]Custom memory '{memory_id}' deleted successfully.[/bold green]")
+        if exists:
+            _remove_memory(_load_index(), memory_type, memory_id)
+            _echo(f"Custom memory '{memory_id}' deleted successfully.", "green")
         else:
-            console.print(f"[bold red]Custom memory '{memory_id}' not found.[/bold red]")
+            _echo(f"Custom memory '{memory_id}' not found.", "red")
 
 def create_custom_memory(memory_id: str, description: str, content_file: str = None, content: str = None) -> None:
     """Create a new custom memory."""
-    memory_data = load_memory_data()
-    
-    if "custom_memories" not in memory_data:
-        memory_data["custom_memories"] = {}
+    setup_memory_dirs()
     
-    if memory_id in memory_data["custom_memories"]:
-        console.print(f"[bold yellow]Custom memory '{memory_id}' already exists. Updating it.[/bold yellow]")
+    if _memory_path("custom", memory_id).exists():
+        _echo(f"Custom memory '{memory_id}' already exists. Updating it.", "yellow")
     
     # Get content from file if provided
     if content_file:
         try:
-            with open(content_file, 'r') as f:
-                content = f.read()
+            content = Path(content_file).read_text(encoding="utf-8")
         except Exception as e:
-            console.print(f"[bold red]Error reading file {content_file}: {str(e)}[/bold red]")
+            _echo(f"Error reading file {content_file}: {str(e)}", "red")
             return
     
     if not content:
-        console.print("[bold red]No content provided for custom memory.[/bold red]")
+        _echo("No content provided for custom memory.", "red")
         return
     
-    memory_data["custom_memories"][memory_id] = {
+    _write_json(_memory_path("custom", memory_id), {
         "description": description,
         "content": content
-    }
+    }, fsync=True, compress=True)
     
-    save_memory_data(memory_data)
-    console.print(f"[bold green]Custom memory '{memory_id}' created/updated successfully.[/bold green]")
+    index = _load_index()
+    index["custom_memories"][memory_id] = {"description": description, "mtime": time.time()}
+    _save_index(index, fsync=True)
+    _echo(f"Custom memory '{memory_id}' created/updated successfully.", "green")
 
-def main():
+def add_conversation_message(memory_id: str, role: str, content_file: str = None, content: str = None) -> None:
+    """Append a message to a conversation memory."""
+    # Get content from file if provided
+    if content_file:
+        try:
+            content = Path(content_file).read_text(encoding="utf-8")
+        except Exception as e:
+            _echo(f"Error reading file {content_file}: {str(e)}", "red")
+            return
+    
+    if not content:
+        _echo("No content provided for the message.", "red")
+        return
+    
+    append_message(memory_id, role, content)
+    _echo(f"Message added to conversation memory '{memory_id}'.", "green")
+
+# Handler for each subcommand, called with the parsed arguments
+COMMANDS = {
+    "list": lambda args: list_memories(),
+    "view": lambda args: view_memory(args.memory_id, args.type),
+    "delete": lambda args: delete_memory(args.memory_id, args.type),
+    "create": lambda args: create_custom_memory(args.memory_id, args.description, args.file, args.content),
+    "append": lambda args: add_conversation_message(args.memory_id, args.role, args.file, args.content),
+}
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(description="Manage Claude Terminal Client memories")
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
@@ -193,18 +573,30 @@ def main():
     create_parser.add_argument("--file", "-f", help="File containing the memory content")
     create_parser.add_argument("--content", "-c", help="Memory content as a string")
     
-    args = parser.parse_args()
+    # Append command
+    append_parser = subparsers.add_parser("append", help="Append a message to a conversation memory")
+    append_parser.add_argument("memory_id", help="ID of the conversation memory (created if missing)")
+    append_parser.add_argument("--role", "-r", choices=["user", "assistant"], default="user",
+                               help="Role of the message author (default: user)")
+    append_parser.add_argument("--file", "-f", help="File containing the message content")
+    append_parser.add_argument("--content", "-c", help="Message content as a string")
     
-    if args.command == "list":
+    return parser
+
+def main():
+    # Plain `list` is the most common invocation and needs no argument parsing
+    if sys.argv[1:] == ["list"]:
         list_memories()
-    elif args.command == "view":
-        view_memory(args.memory_id, args.type)
-    elif args.command == "delete":
-        delete_memory(args.memory_id, args.type)
-    elif args.command == "create":
-        create_custom_memory(args.memory_id, args.description, args.file, args.content)
-    else:
+        return
+    
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    command = COMMANDS.get(args.command)
+    if command is None:
         parser.print_help()
+    else:
+        command(args)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
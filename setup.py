@@ -22,6 +22,10 @@ setup(
     install_requires=[
         "rich>=10.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+        "zstd": ["zstandard>=0.15.0"],
+    },
     entry_points={
         "console_scripts": [
             "claude-memory=claude_memory:main",